@@ -8,24 +8,45 @@ multiline handling and specified line spacing.
 Requirements:
 - PyMuPDF (fitz): pip install PyMuPDF
 - json (built-in)
+- orjson (optional, faster JSON loading): pip install orjson
 """
 
 import json
+import math
+import re
 import fitz  # PyMuPDF
 import sys
 import os
-from typing import Dict, List, Tuple, Any
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple, Any
+
+try:
+    import orjson
+except ImportError:  # Fall back to the built-in parser
+    orjson = None
+
+# Merge duplicate objects and compress streams when writing the filled PDF
+SAVE_OPTIONS = {"garbage": 4, "deflate": True}
+
+# Drawn in place of characters Helvetica has no glyph for (CJK, emoji, ...).
+# TextWriter would otherwise embed an entire fallback font (up to ~3.5 MB)
+# for a single such character. Middle dot is what insert_text used to show.
+MISSING_GLYPH_REPLACEMENT = "\u00b7"
 
 
 class PDFFormFiller:
-    def __init__(self, pdf_path: str, json_path: str, output_path: str = None):
+    def __init__(self, pdf_path: str, json_path: str, output_path: str = None,
+                 data: Dict[str, Any] = None, pdf_bytes: bytes = None):
         """
         Initialize the PDF form filler.
         
         Args:
             pdf_path: Path to the input PDF file
-            json_path: Path to the JSON data file
+            json_path: Path to the JSON data file (ignored when data is given)
             output_path: Path for the output PDF (defaults to adding '_filled' suffix)
+            data: Already-parsed field data to use instead of reading json_path
+            pdf_bytes: Contents of the input PDF, opened instead of reading pdf_path
         """
         self.pdf_path = pdf_path
         self.json_path = json_path
@@ -33,15 +54,40 @@ class PDFFormFiller:
         self.line_spacing_multiplier = 2.20
         self.max_lines_per_field = None  # Set to a number to limit lines per field (e.g., 5)
         self.field_specific_line_limits = {}  # Field-specific line limits
+        self.verbose = False  # Set to True to print progress for every field
+        
+        # Helvetica, loaded once and shared by every line of text written
+        self._font = fitz.Font("helv")
+        
+        # Wrapped lines keyed by (text, max_width, font_size, font_name)
+        self._wrap_cache: Dict[Tuple[str, float, float, str], List[str]] = {}
         
         # Track overflow text for each field
-        self.field_overflow_data = {}  # Stores overflow info for each field
+        self._field_overflow_data = {}  # Stores overflow info for each field
+        self._pending_overflow = []  # Filled fields not yet folded into _field_overflow_data
         
         # Load JSON data
-        self.data = self._load_json_data()
+        self.data = data if data is not None else self._load_json_data()
         
         # Open PDF document
-        self.doc = fitz.open(pdf_path)
+        if pdf_bytes is not None:
+            self.doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        else:
+            self.doc = fitz.open(pdf_path)
+        
+    @classmethod
+    def from_dict(cls, pdf_path: str, data: Dict[str, Any], output_path: str = None,
+                  pdf_bytes: bytes = None) -> "PDFFormFiller":
+        """
+        Create a filler from field data that is already in memory.
+        
+        Args:
+            pdf_path: Path to the input PDF file
+            data: Dictionary of field_name -> value
+            output_path: Path for the output PDF (defaults to adding '_filled' suffix)
+            pdf_bytes: Contents of the input PDF, opened instead of reading pdf_path
+        """
+        return cls(pdf_path, None, output_path, data=data, pdf_bytes=pdf_bytes)
         
     def _generate_output_path(self) -> str:
         """Generate output path by adding '_filled' suffix to input PDF."""
@@ -51,8 +97,10 @@ class PDFFormFiller:
     def _load_json_data(self) -> Dict[str, Any]:
         """Load and return JSON data from file."""
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Hand the whole file to the parser as bytes in one call
+            with open(self.json_path, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             raise FileNotFoundError(f"JSON file not found: {self.json_path}")
         except json.JSONDecodeError as e:
@@ -106,6 +154,31 @@ class PDFFormFiller:
         lines = self._split_text_to_lines(str(text), available_width, font_size)
         return len(lines)
         
+    @property
+    def field_overflow_data(self) -> Dict[str, Dict]:
+        """
+        Overflow information for every filled field, keyed by field name.
+        
+        Fields are recorded as plain tuples while filling and only turned
+        into dictionaries here, the first time the data is read.
+        """
+        if self._pending_overflow:
+            for field_name, total_lines, displayed_lines, overflow_lines, original_text in self._pending_overflow:
+                self._field_overflow_data[field_name] = {
+                    'total_lines': total_lines,
+                    'displayed_lines': displayed_lines,
+                    'overflow_lines': overflow_lines,
+                    'original_text': original_text
+                }
+            self._pending_overflow.clear()
+        return self._field_overflow_data
+
+    @field_overflow_data.setter
+    def field_overflow_data(self, value: Dict[str, Dict]):
+        # Replaces everything recorded so far, including fields not yet folded in
+        self._field_overflow_data = value
+        self._pending_overflow.clear()
+
     def get_field_overflow_text(self, field_name: str) -> str:
         """
         Get the overflow text that was truncated from a specific field.
@@ -177,13 +250,8 @@ class PDFFormFiller:
         Returns:
             Width of the text in points
         """
-        try:
-            # Use a more accurate approximation that matches real text width better
-            # Helvetica at 11pt averages about 0.45-0.5 width per character
-            return len(text) * font_size * 0.45  # More aggressive/accurate approximation
-        except:
-            # Even more conservative fallback
-            return len(text) * font_size * 0.5
+        # Helvetica at 11pt averages about 0.45-0.5 width per character
+        return len(text) * font_size * 0.45  # More aggressive/accurate approximation
         
     def _split_text_to_lines(self, text: str, max_width: float, font_size: float, 
                             font_name: str = "helv") -> List[str]:
@@ -202,43 +270,74 @@ class PDFFormFiller:
         if not text:
             return [""]
             
+        # Most values are short, a single-spaced one that fits is its own line
+        if (self._get_text_width(text, font_size, font_name) <= max_width and text.isprintable() and
+                text[0] != " " and text[-1] != " " and "  " not in text):
+            return [text]
+            
+        # Reuse the result if this text was already wrapped at this width
+        cache_key = (text, max_width, font_size, font_name)
+        cached_lines = self._wrap_cache.get(cache_key)
+        if cached_lines is not None:
+            return cached_lines
+            
         # Use full width for maximum text flow
         effective_width = max_width  # Use the complete available width
         
-        words = text.split()
+        # Keep the line breaks in the text, wrapping each paragraph on its own
         lines = []
-        current_line = ""
+        for paragraph in text.splitlines():
+            lines.extend(self._wrap_paragraph(paragraph, effective_width, font_size, font_name))
+            
+        lines = lines if lines else [""]
+        self._wrap_cache[cache_key] = lines
+        return lines
+        
+    def _wrap_paragraph(self, text: str, max_width: float, font_size: float, font_name: str) -> List[str]:
+        """
+        Word wrap a single paragraph of text that contains no line breaks.
         
-        for word in words:
-            # Test if adding this word would exceed the width
-            test_line = current_line + (" " if current_line else "") + word
-            test_width = self._get_text_width(test_line, font_size, font_name)
+        Args:
+            text: The paragraph to wrap
+            max_width: Maximum width for each line
+            font_size: Font size for text measurement
+            font_name: Font name for text measurement
             
-            if test_width <= effective_width:
-                # Word fits, add it to current line
-                current_line = test_line
-            else:
-                # Word doesn't fit
-                if current_line:
-                    # Save current line and start new line with this word
-                    lines.append(current_line)
-                    current_line = word
-                    
-                    # Check if the single word is too long for a line
-                    if self._get_text_width(word, font_size, font_name) > effective_width:
-                        # Break long word into smaller parts
-                        char_lines = self._break_long_word(word, effective_width, font_size, font_name)
-                        lines.extend(char_lines[:-1])  # Add all but the last part
-                        current_line = char_lines[-1] if char_lines else ""  # Keep last part for next iteration
-                else:
-                    # Even single word doesn't fit, break it
-                    char_lines = self._break_long_word(word, effective_width, font_size, font_name)
-                    lines.extend(char_lines[:-1])
-                    current_line = char_lines[-1] if char_lines else ""
+        Returns:
+            List of text lines that fit within max_width, [""] for a blank paragraph
+        """
+        # Work on a single-spaced copy so every line is one slice of it
+        text = " ".join(text.split())
         
+        # Every character has the same width, so a line's width follows from its span
+        char_width = self._get_text_width(" ", font_size, font_name)
+        
+        lines = []
+        line_start = None  # Start index of the current line, None before the first word
+        line_end = 0
+        
+        for match in re.finditer(r"\S+", text):
+            word_start, word_end = match.span()
+            
+            if line_start is not None:
+                if (word_end - line_start) * char_width <= max_width:
+                    # Word fits, extend the current line over it
+                    line_end = word_end
+                    continue
+                # Word doesn't fit, save current line
+                lines.append(text[line_start:line_end])
+                
+            if (word_end - word_start) * char_width <= max_width:
+                line_start, line_end = word_start, word_end
+            else:
+                # Even single word doesn't fit, break it
+                char_lines = self._break_long_word(match.group(), max_width, font_size, font_name)
+                lines.extend(char_lines[:-1])  # Add all but the last part
+                line_start, line_end = word_end - len(char_lines[-1]), word_end  # Keep last part for next line
+                
         # Add the last line if it has content
-        if current_line:
-            lines.append(current_line)
+        if line_start is not None:
+            lines.append(text[line_start:line_end])
             
         return lines if lines else [""]
         
@@ -258,33 +357,24 @@ class PDFFormFiller:
         if not word:
             return [""]
             
-        segments = []
-        current_segment = ""
-        
-        for char in word:
-            test_segment = current_segment + char
-            if self._get_text_width(test_segment, font_size, font_name) <= max_width:
-                current_segment = test_segment
-            else:
-                if current_segment:
-                    segments.append(current_segment)
-                    current_segment = char
-                else:
-                    # Even single character is too wide, just add it anyway
-                    segments.append(char)
-                    current_segment = ""
-        
-        if current_segment:
-            segments.append(current_segment)
-            
-        return segments if segments else [word]
-        
-    def _fill_text_field(self, page: fitz.Page, field: Dict, text: str):
+        # Equal-width characters make every segment the same length, so all
+        # split points follow from the largest prefix length that fits
+        char_width = self._get_text_width(" ", font_size, font_name)
+        stride = max(1, int(max_width // char_width))
+        # The floor estimate can be one off either way from rounding; settle it
+        # with the same width comparison a character-by-character fill makes
+        while stride > 1 and self._get_text_width(" " * stride, font_size, font_name) > max_width:
+            stride -= 1
+        while self._get_text_width(" " * (stride + 1), font_size, font_name) <= max_width:
+            stride += 1
+        return [word[i:i + stride] for i in range(0, len(word), stride)]
+        
+    def _fill_text_field(self, writer: fitz.TextWriter, field: Dict, text: str):
         """
         Fill a text field with proper multiline handling and top padding.
         
         Args:
-            page: The PDF page containing the field
+            writer: TextWriter collecting the text for the page containing the field
             field: Field dictionary containing position and properties
             text: Text content to fill
         """
@@ -294,10 +384,11 @@ class PDFFormFiller:
         # Get field rectangle
         rect = field.get("rect")
         if not rect:
-            print(f"Warning: No rectangle found for field")
+            if self.verbose:
+                print(f"Warning: No rectangle found for field")
             return
             
-        field_rect = fitz.Rect(rect)
+        field_rect = rect if isinstance(rect, fitz.Rect) else fitz.Rect(rect)
         field_name = field.get("field_name", "")
         
         # Fixed font size as requested
@@ -313,43 +404,30 @@ class PDFFormFiller:
         available_height = field_rect.height - top_padding - bottom_margin
         
         # Split text into lines using intelligent word wrapping
-        all_lines = self._split_text_to_lines(str(text), available_width, font_size)
+        all_lines = self._split_text_to_lines(text, available_width, font_size)
         total_lines_needed = len(all_lines)
         
         # Apply line limits (field-specific takes priority over global)
-        max_lines = None
-        if field_name in self.field_specific_line_limits:
-            max_lines = self.field_specific_line_limits[field_name]
-            print(f"Using field-specific limit of {max_lines} lines for '{field_name}'")
+        max_lines = self.field_specific_line_limits.get(field_name)
+        if max_lines is not None:
+            if self.verbose:
+                print(f"Using field-specific limit of {max_lines} lines for '{field_name}'")
         elif self.max_lines_per_field is not None:
             max_lines = self.max_lines_per_field
-            print(f"Using global limit of {max_lines} lines")
+            if self.verbose:
+                print(f"Using global limit of {max_lines} lines")
             
         # Determine which lines to display and which overflow
         if max_lines is not None and len(all_lines) > max_lines:
             lines = all_lines[:max_lines]  # Lines to display
             overflow_lines = all_lines[max_lines:]  # Lines that overflow
             
-            # Store overflow information
-            self.field_overflow_data[field_name] = {
-                'total_lines': total_lines_needed,
-                'displayed_lines': len(lines),
-                'overflow_lines': overflow_lines,
-                'original_text': str(text)
-            }
-            
-            print(f"Text truncated to {max_lines} lines for field '{field_name}' (total needed: {total_lines_needed})")
+            if self.verbose:
+                print(f"Text truncated to {max_lines} lines for field '{field_name}' (total needed: {total_lines_needed})")
         else:
             lines = all_lines  # No truncation needed
+            overflow_lines = []
             
-            # Still track info even if no overflow
-            self.field_overflow_data[field_name] = {
-                'total_lines': total_lines_needed,
-                'displayed_lines': len(lines),
-                'overflow_lines': [],
-                'original_text': str(text)
-            }
-        
         # Calculate line spacing - fixed at 2.20x
         line_spacing = self._calculate_line_spacing(font_size)
         
@@ -360,33 +438,51 @@ class PDFFormFiller:
         start_x = field_rect.x0 + left_margin
         start_y = field_rect.y0 + top_padding + font_size  # Start from top with padding and font size offset
         
+        # Lines whose baseline would fall below the bottom margin don't fit in the field
+        max_visible = max(0, math.floor((field_rect.y1 - bottom_margin - start_y) / line_spacing) + 1)
+        if len(lines) > max_visible:
+            if self.verbose:
+                print(f"Warning: Text truncated - not all lines fit in field (keeping font size 11)")
+            overflow_lines = lines[max_visible:] + overflow_lines
+            lines = lines[:max_visible]
+            
+        # Store overflow information, still tracked even if no overflow
+        self._pending_overflow.append((field_name, total_lines_needed, len(lines), overflow_lines, text))
+        
         # Add each line of text
         for i, line in enumerate(lines):
             y_position = start_y + (i * line_spacing)
             
-            # Stop if we've exceeded the field height
-            if y_position > field_rect.y1 - bottom_margin:
-                print(f"Warning: Text truncated - not all lines fit in field (keeping font size 11)")
-                break
-                
-            # Insert text
+            # Queue text, the writer emits it for the whole page at once
             try:
-                page.insert_text(
-                    point=(start_x, y_position),
-                    text=line,
-                    fontsize=font_size,
-                    color=(0, 0, 0),  # Black color
-                    fontname="helv"  # Helvetica
-                )
+                writer.append((start_x, y_position), self._replace_missing_glyphs(line),
+                              font=self._font, fontsize=font_size)
             except Exception as e:
                 print(f"Error inserting text '{line}': {e}")
                 
-    def _fill_checkbox_field(self, page: fitz.Page, field: Dict, value: str):
+    def _replace_missing_glyphs(self, text: str) -> str:
+        """
+        Replace characters the Helvetica font can't draw, so no fallback font is embedded.
+        
+        Args:
+            text: Line of text about to be written
+            
+        Returns:
+            The text with every unsupported character replaced by MISSING_GLYPH_REPLACEMENT
+        """
+        # Helvetica covers all of ASCII, which is nearly every line
+        if text.isascii():
+            return text
+        has_glyph = self._font.has_glyph
+        return "".join(char if char.isascii() or has_glyph(ord(char)) else MISSING_GLYPH_REPLACEMENT
+                       for char in text)
+        
+    def _fill_checkbox_field(self, shape: fitz.utils.Shape, field: Dict, value: str):
         """
         Fill a checkbox field.
         
         Args:
-            page: The PDF page containing the field
+            shape: Shape collecting the drawings for the page containing the field
             field: Field dictionary containing position and properties
             value: Value to determine if checkbox should be checked
         """
@@ -397,23 +493,19 @@ class PDFFormFiller:
         if not rect:
             return
             
-        field_rect = fitz.Rect(rect)
+        field_rect = rect if isinstance(rect, fitz.Rect) else fitz.Rect(rect)
         
         # Draw checkmark or X
         # Create a simple checkmark using drawing commands
         try:
-            # Draw an X or checkmark
-            page.draw_line(
-                p1=(field_rect.x0 + 2, field_rect.y0 + 2),
-                p2=(field_rect.x1 - 2, field_rect.y1 - 2),
-                color=(0, 0, 0),
-                width=2
+            # Draw an X or checkmark, stroked with the rest of the page's checkmarks
+            shape.draw_line(
+                (field_rect.x0 + 2, field_rect.y0 + 2),
+                (field_rect.x1 - 2, field_rect.y1 - 2)
             )
-            page.draw_line(
-                p1=(field_rect.x1 - 2, field_rect.y0 + 2),
-                p2=(field_rect.x0 + 2, field_rect.y1 - 2),
-                color=(0, 0, 0),
-                width=2
+            shape.draw_line(
+                (field_rect.x1 - 2, field_rect.y0 + 2),
+                (field_rect.x0 + 2, field_rect.y1 - 2)
             )
         except Exception as e:
             print(f"Error drawing checkbox: {e}")
@@ -446,59 +538,106 @@ class PDFFormFiller:
         
     def fill_form(self):
         """Main method to fill the form with JSON data."""
-        print(f"Loading PDF: {self.pdf_path}")
-        print(f"Loading JSON data: {self.json_path}")
+        if self.verbose:
+            print(f"Loading PDF: {self.pdf_path}")
+            print(f"Loading JSON data: {self.json_path or 'in-memory data'}")
         
         # Get all form fields
         form_fields = self.get_form_fields()
         
-        print(f"Found {len(form_fields)} form fields")
+        if self.verbose:
+            print(f"Found {len(form_fields)} form fields")
         
         if not form_fields:
-            print("No form fields found in PDF. Looking for annotations...")
+            if self.verbose:
+                print("No form fields found in PDF. Looking for annotations...")
             # Try to get annotations if no form fields found
             self._fill_using_annotations()
             return
             
         # Process each form field
         filled_count = 0
+        doc = self.doc
+        
+        # get_form_fields walks the pages in order, so fields arrive grouped by page.
+        # Pages are filled one after another: MuPDF documents must not be used
+        # from several threads at once.
+        for page_num, page_fields in groupby(form_fields, key=itemgetter("page")):
+            filled_count += self._fill_page(doc[page_num], page_fields)
+                
+        if self.verbose:
+            print(f"Filled {filled_count} fields")
+        
+    def _fill_page(self, page: fitz.Page, page_fields: Iterable[Dict]) -> int:
+        """
+        Fill the form fields of a single page.
+        
+        Text is collected in one TextWriter and checkmarks in one Shape, each
+        written to the page once after all of its fields are processed.
+        
+        Args:
+            page: The PDF page containing the fields
+            page_fields: Field dictionaries of the fields on this page
+            
+        Returns:
+            Number of fields filled from the JSON data
+        """
+        filled_count = 0
+        data_get = self.data.get
+        writer = None  # Created on first text field
+        shape = None  # Created on first checkbox
         
-        for field in form_fields:
+        for field in page_fields:
             field_name = field["field_name"]
-            page_num = field["page"]
-            page = self.doc[page_num]
             
             # Look for matching data in JSON
-            json_value = self.data.get(field_name)
+            json_value = data_get(field_name)
             
             if json_value is not None:
-                print(f"Filling field '{field_name}' with data")
+                if self.verbose:
+                    print(f"Filling field '{field_name}' with data")
                 
-                field_type = field["field_type"]
+                value = str(json_value)
                 
-                if field_type in [fitz.PDF_WIDGET_TYPE_TEXT, fitz.PDF_WIDGET_TYPE_LISTBOX]:
-                    self._fill_text_field(page, field, str(json_value))
-                elif field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-                    self._fill_checkbox_field(page, field, str(json_value))
+                if field["field_type"] == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+                    if shape is None:
+                        shape = page.new_shape()
+                    self._fill_checkbox_field(shape, field, value)
                 else:
-                    # Try to fill as text field for other types
-                    self._fill_text_field(page, field, str(json_value))
+                    # Text and listbox fields, other types are tried as text too
+                    if writer is None:
+                        writer = fitz.TextWriter(page.rect)
+                    self._fill_text_field(writer, field, value)
                 
                 filled_count += 1
             else:
-                print(f"No data found for field '{field_name}'")
+                if self.verbose:
+                    print(f"No data found for field '{field_name}'")
                 
-        print(f"Filled {filled_count} fields")
+        if writer is not None:
+            writer.write_text(page, color=(0, 0, 0))  # Black color
+        if shape is not None:
+            shape.finish(color=(0, 0, 0), width=2, closePath=False)
+            shape.commit()
+            
+        return filled_count
         
     def _fill_using_annotations(self):
         """Alternative method to fill using annotations if form fields are not found."""
-        print("Attempting to fill using annotations...")
+        if self.verbose:
+            print("Attempting to fill using annotations...")
         
         filled_count = 0
         
+        # Lowercase the JSON keys once instead of for every annotation
+        lowered_items = [(json_key.lower(), json_key, json_value)
+                         for json_key, json_value in self.data.items() if json_value]
+        
         for page_num in range(len(self.doc)):
             page = self.doc[page_num]
             
+            writer = fitz.TextWriter(page.rect)
+            
             # Get all annotations
             annotations = page.annots()
             
@@ -506,13 +645,14 @@ class PDFFormFiller:
                 annot_dict = annot.info
                 annot_content = annot_dict.get("content", "")
                 annot_rect = annot.rect
+                lowered_content = annot_content.lower()
                 
                 # Try to match annotation with JSON data
-                for json_key, json_value in self.data.items():
-                    if json_value and (json_key.lower() in annot_content.lower() or 
-                                     annot_content.lower() in json_key.lower()):
+                for lowered_key, json_key, json_value in lowered_items:
+                    if lowered_key in lowered_content or lowered_content in lowered_key:
                         
-                        print(f"Filling annotation '{annot_content}' with '{json_key}' data")
+                        if self.verbose:
+                            print(f"Filling annotation '{annot_content}' with '{json_key}' data")
                         
                         # Create a pseudo-field for the annotation
                         pseudo_field = {
@@ -521,23 +661,36 @@ class PDFFormFiller:
                             "field_type": "text"
                         }
                         
-                        self._fill_text_field(page, pseudo_field, str(json_value))
+                        self._fill_text_field(writer, pseudo_field, str(json_value))
                         filled_count += 1
                         break
                         
-        print(f"Filled {filled_count} annotations")
+            writer.write_text(page, color=(0, 0, 0))  # Black color
+            
+        if self.verbose:
+            print(f"Filled {filled_count} annotations")
         
     def save(self):
         """Save the filled PDF to the output path."""
         try:
-            self.doc.save(self.output_path)
-            print(f"Filled PDF saved to: {self.output_path}")
+            self.doc.save(self.output_path, **SAVE_OPTIONS)
+            if self.verbose:
+                print(f"Filled PDF saved to: {self.output_path}")
+        except Exception as e:
+            print(f"Error saving PDF: {e}")
+            raise
+            
+    def to_bytes(self) -> bytes:
+        """Return the filled PDF as bytes without writing it to disk."""
+        try:
+            return self.doc.tobytes(**SAVE_OPTIONS)
         except Exception as e:
             print(f"Error saving PDF: {e}")
             raise
             
     def close(self):
         """Close the PDF document."""
+        self._wrap_cache.clear()
         if hasattr(self, 'doc'):
             self.doc.close()
             
@@ -571,6 +724,7 @@ def main():
     try:
         # Fill the form
         with PDFFormFiller(pdf_file, json_file, output_file) as filler:
+            filler.verbose = True
             filler.fill_form()
             filler.save()
             
@@ -1,29 +1,145 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any, Optional
-import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import gzip
+import hashlib
 import json
+import logging
 import os
-import base64
+import orjson
+import sys
+import pybase64
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from fill_pdf_form import PDFFormFiller
 
+log = logging.getLogger("ssa_api")
+
+# Worker processes for blocking form filling, created on startup. Filling is
+# CPU-bound and PyMuPDF is not thread-safe, so each fill runs in its own
+# process; arguments and results must be picklable.
+PDF_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+# Each idle worker holds ~52 MB, so without PDF_WORKERS set the pool follows
+# the CPUs this process may run on, up to a small cap
+PDF_WORKERS_CAP = 4
+
+def _default_pdf_workers() -> int:
+    """CPUs this process may use (its affinity mask, not the host's count), capped"""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:  # Not available on macOS or Windows
+        cpus = os.cpu_count() or 1
+    return min(cpus, PDF_WORKERS_CAP)
+
+PDF_WORKERS = max(1, int(os.environ.get("PDF_WORKERS") or _default_pdf_workers()))
+
+# Filled PDFs of recent requests, so retries of the same submission are not
+# filled again. Each entry is ~720 KB, plus ~1 MB once its base64 is built.
+PDF_CACHE_SIZE = 32
+_PDF_CACHE: "OrderedDict[bytes, FilledPDF]" = OrderedDict()
+
 app = FastAPI(
     title="SSA-3373 PDF Form Filler",
     description="API for filling SSA-3373 forms with custom line limits",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Comma-separated list of allowed origins, e.g. "https://your-app.vercel.app"
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get("CORS_ORIGINS", "*").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure for your specific Vercel domain in production
+    allow_origins=CORS_ORIGINS,  # Set CORS_ORIGINS to your Vercel domain in production
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["Content-Disposition", "Content-Length", "Content-Encoding"],
+    max_age=86400,  # Let browsers cache preflight results for a day
+)
+
+class SkipPathsGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves responses for the given paths untouched"""
+    
+    def __init__(self, app: ASGIApp, skip_paths=(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.skip_paths = frozenset(skip_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON responses. /fill-ssa-form returns a PDF whose streams are
+# already deflated, and /fill-ssa-form-gpt compresses its own ~1 MB body off
+# the event loop (GZipMiddleware compresses inline, ~35 ms for that body).
+GZIP_MINIMUM_SIZE = 1024
+GZIP_LEVEL = 5
+
+app.add_middleware(
+    SkipPathsGZipMiddleware,
+    skip_paths=["/fill-ssa-form", "/fill-ssa-form-gpt"],
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_LEVEL,
 )
 
+async def _gzip_json_response(payload: dict, accept_encoding: str) -> Response:
+    """JSON response, gzipped in a worker thread when the client accepts it"""
+    body = orjson.dumps(payload)
+    if len(body) < GZIP_MINIMUM_SIZE or "gzip" not in accept_encoding:
+        return Response(content=body, media_type="application/json")
+    
+    # zlib releases the GIL while compressing, so this doesn't stall other requests
+    compressed = await run_in_threadpool(gzip.compress, body, GZIP_LEVEL)
+    return Response(
+        content=compressed,
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+    )
+
+@app.on_event("startup")
+def configure_logging():
+    """Log at uvicorn's --log-level / log_level, through uvicorn's own handlers"""
+    # uvicorn only configures its own loggers; without this ssa_api would sit
+    # at the root logger's WARNING level with no handler of its own
+    log.setLevel(logging.getLogger("uvicorn.error").getEffectiveLevel())
+    if not log.handlers:
+        log.handlers = list(logging.getLogger("uvicorn").handlers) or [logging.StreamHandler()]
+        log.propagate = False
+
+@app.on_event("startup")
+def start_pdf_executor():
+    global PDF_EXECUTOR
+    
+    # Load templates before the workers start so forked processes inherit them
+    for template_name in AVAILABLE_TEMPLATES:
+        _load_template_bytes(os.path.join("templates", template_name))
+    
+    PDF_EXECUTOR = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    
+    # Start the worker processes now rather than on the first request
+    for future in [PDF_EXECUTOR.submit(_warm_up) for _ in range(PDF_WORKERS)]:
+        future.result()
+
+@app.on_event("shutdown")
+def stop_pdf_executor():
+    global PDF_EXECUTOR
+    if PDF_EXECUTOR is not None:
+        PDF_EXECUTOR.shutdown(wait=True)
+        PDF_EXECUTOR = None
+
 class FormRequest(BaseModel):
     fields: Dict[str, Any]
     line_limits: Optional[Dict[str, int]] = None
@@ -33,8 +149,9 @@ class GPTFormRequest(BaseModel):
     template_name: Optional[str] = "ssa-3373-formatted-blank.pdf"
     fields: Dict[str, str]
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        str_max_length=10_000,  # Reject oversized values before they reach the PDF worker
+        json_schema_extra={
             "example": {
                 "template_name": "ssa-3373-formatted-blank.pdf",
                 "fields": {
@@ -48,23 +165,24 @@ class GPTFormRequest(BaseModel):
                 }
             }
         }
+    )
 
 @app.post("/fill-ssa-form-gpt")
-async def fill_ssa_form_gpt(request: GPTFormRequest):
+async def fill_ssa_form_gpt(request: GPTFormRequest, http_request: Request):
     """
     GPT Actions compatible endpoint - returns PDF as downloadable data URL
     """
     try:
-        print("=== GPT ENDPOINT CALLED ===")
-        print(f"Template: {request.template_name}")
-        print(f"Fields count: {len(request.fields)}")
+        log.debug("GPT endpoint called - template: %s, fields: %d",
+                  request.template_name, len(request.fields))
         
         # Validate fields
         if not request.fields or len(request.fields) == 0:
             return {"error": "Missing or empty fields", "status": "error"}, 400
         
         # Generate PDF using existing logic
-        pdf_content = await generate_pdf_for_gpt(request.template_name, request.fields)
+        filled_pdf = await _produce_pdf(request.template_name, request.fields)
+        pdf_content = filled_pdf.content
         
         # Validate PDF was generated
         if not pdf_content or len(pdf_content) < 1000:
@@ -78,30 +196,26 @@ async def fill_ssa_form_gpt(request: GPTFormRequest):
         filename = f"ssa-3373-filled_{timestamp}.pdf"
         
         # Convert to base64 for GPT Actions
-        pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
+        pdf_base64 = filled_pdf.base64
         
         # Create data URL for immediate download
         data_url = f"data:application/pdf;base64,{pdf_base64}"
         
-        print(f"=== PDF PROCESSED ===")
-        print(f"PDF size: {len(pdf_content)} bytes")
-        print(f"Base64 size: {len(pdf_base64)} characters")
-        print(f"Filename: {filename}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("PDF processed - size: %d bytes, base64 size: %d characters, filename: %s",
+                     len(pdf_content), 4 * ((len(pdf_content) + 2) // 3), filename)
         
-        return {
+        return await _gzip_json_response({
             "status": "success",
             "message": "PDF generated successfully and ready for download",
             "filename": filename,
             "download_url": data_url,
             "pdf_size_kb": round(len(pdf_content) / 1024, 1),
             "download_ready": True
-        }
+        }, http_request.headers.get("accept-encoding", ""))
         
     except Exception as e:
-        print(f"=== ERROR IN GPT ENDPOINT ===")
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in GPT endpoint: %s", e)
         
         return {
             "status": "error",
@@ -122,262 +236,285 @@ async def fill_ssa_form(request: FormRequest):
         PDF file as download
     """
     try:
-        # Get template path
-        template_path = os.path.join("templates", request.template_name)
-        if not os.path.exists(template_path):
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Template {request.template_name} not found. Available templates: {get_available_templates()}"
-            )
+        pdf_content = (await _produce_pdf(request.template_name, request.fields, request.line_limits)).content
         
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as json_temp:
-            json.dump(request.fields, json_temp, indent=2)
-            json_temp_path = json_temp.name
-        
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as output_temp:
-            output_temp_path = output_temp.name
-        
-        try:
-            # Fill the form using your existing PDFFormFiller logic
-            with PDFFormFiller(template_path, json_temp_path, output_temp_path) as filler:
-                
-                # Apply line limits (use provided or default)
-                line_limits = request.line_limits or get_default_line_limits()
-                filler.set_multiple_field_limits(line_limits)
-                
-                # Fill and save the form
-                filler.fill_form()
-                filler.save()
-            
-            # Read the filled PDF
-            with open(output_temp_path, 'rb') as pdf_file:
-                pdf_content = pdf_file.read()
-            
-            return Response(
-                content=pdf_content,
-                media_type='application/pdf',
-                headers={
-                    "Content-Disposition": "attachment; filename=filled_ssa-3373.pdf",
-                    "Content-Type": "application/pdf",  # Explicit Content-Type
-                    "Content-Length": str(len(pdf_content)),  # Critical for GPT Actions
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                    "Access-Control-Expose-Headers": "Content-Disposition, Content-Length",  # Key for CORS
-                    "Accept-Ranges": "bytes"  # Helps with large file downloads
-                }
-            )
-            
-        finally:
-            # Cleanup temporary files
-            if os.path.exists(json_temp_path):
-                os.unlink(json_temp_path)
-            if os.path.exists(output_temp_path):
-                os.unlink(output_temp_path)
+        return Response(
+            content=pdf_content,
+            media_type='application/pdf',
+            headers={
+                "Content-Disposition": "attachment; filename=filled_ssa-3373.pdf",
+                "Content-Type": "application/pdf",  # Explicit Content-Type
+                "Content-Length": str(len(pdf_content)),  # Critical for GPT Actions
+                "Cache-Control": "no-cache, no-store, must-revalidate",
+                "Pragma": "no-cache",
+                "Expires": "0",
+                "Access-Control-Expose-Headers": "Content-Disposition, Content-Length",  # Key for CORS
+                "Accept-Ranges": "bytes"  # Helps with large file downloads
+            }
+        )
                 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Form filling failed: {str(e)}")
 
-def get_default_line_limits():
-    """Return the default line limits for SSA-3373 form fields"""
-    return {
-        # Main narrative fields
-        "N5text[0]": 7,      # Disability explanation
-        "N6text[0]": 4,      # Wake up to bed each day description
-        "N7text[0]": 1,      # Take care
-        "N9IfYesField[0]": 1, # Yes pets
-        "N10Field[0]": 1,     # What could you do that you can't now
-        "N11IfYesField[0]": 1, # Sleep
-        
-        # Personal care activities
-        "N12Dress[0]": 1,     # Dressing ability
-        "N12Bathe[0]": 1,     # Bathing ability  
-        "N12CareForHair[0]": 1, # Hair care ability
-        "N12Save[0]": 1,      # Shaving ability
-        "N12FeedSelf[0]": 1,  # Feeding ability
-        "N12UseTheToilet[0]": 1, # Toilet use ability
-        "N12Other[0]": 1,     # Other personal care
-        "N12BIfYesField[0]": 2, # Help received with personal care
-        "N12CIfYesField[0]": 3, # Changes in personal care abilities
-        
-        # Meals and Housework
-        "N13AIfYesField[0]": 2, # Meals Yes Description
-        "N13AHowOftenField[0]": 1, # How often meals
-        "N13AHowLong[0]": 1,   # How long taking meals
-        "N13AAnyChngsField[0]": 1, # Any changes meals
-        "N13BIfNoField[0]": 3, # Meals No Description
-        "N14AField[0]": 2,     # Housework
-        "N14BField[0]": 1,     # How long housework
-        "N14CIfYesField[0]": 1, # Encouraged housework
-        "N14dField[0]": 2,     # No housework - why not?
-        
-        # Transportation and mobility
-        "N15A[0]": 1,         # Go Outside
-        "N15AIfField[0]": 2,   # Why stopped driving
-        "N15CIfNoField[0]": 2, # Public transportation availability
-        "N15DIfYouDontDrive[0]": 2, # Transportation alternatives
-        
-        # Shopping and money management
-        "N16B[0]": 1,         # Shopping information
-        "N16C[0]": 1,         # Shopping limitations
-        "N17AExplain[0]": 2,   # Money handling explanation
-        "N17BIfYes[0]": 4,     # Changes in money management
-        
-        # Hobbies
-        "N18A[0]": 3,         # Hobbies overview
-        "N18B[0]": 2,         # Hobby frequency
-        "N18C[0]": 2,         # Hobby changes
-        
-        # Social activities and going out
-        "N15BOtherField[0]": 1, # Other transportation ability
-        "N19A[0]": 1,         # Explain other social activities
-        "N19B[0]": 1,         # 19c - list things on regular basis
-        "N19BHowOften[0]": 2,  # 19c Yes on need someone to accompany
-        "N19CIfYes[0]": 2,     # 19d Yes on problems with social activities
-        "N19D[0]": 2,         # 19e Describe any changes in social activities
-        
-        # Physical and cognitive limitations
-        "N20A[0]": 3,         # Physical limitations description
-        "N20C[0]": 1,         # Distance before stop and rest
-        "N20CIfYou[0]": 2,     # Rest time
-        "N20D[0]": 2,         # Cognitive/mental limitations
-        "N20F[0]": 2,         # How long follow instructions
-        "N20G[0]": 2,         # How well spoken instructions
-        "N20H[0]": 2,         # How well authority
-        
-        # Work history details
-        "N20IIfYesExplain[0]": 4, # Fired for problems getting along with others
-        "N20IIfYesEmployer[0]": 1, # Employer information
-        "N20J[0]": 1,         # Handle Stress
-        "N20K[0]": 2,         # Handle Change in Routine
-        "N20LIfYes[0]": 9,     # Unusual Behavior
-        
-        # Assistive devices and equipment
-        "N21IfOther[0]": 1,    # Other assistive devices
-        "N21Which[0]": 2,      # Which rx by doctor
-        "N21WhenPrescribed[0]": 2, # When rx by doctor
-        "N21WhenDoYou[0]": 7,   # When do you need to use
-        
-        # Medication details
-        "N22Med1[0]": 1,       # Medication 1 name
-        "N22Effects1[0]": 1,   # Medication 1 side effects
-        "N22Med2[0]": 1,       # Medication 2 name
-        "N22Effects2[0]": 1,   # Medication 2 side effects
-        "N22Med3[0]": 1,       # Medication 3 name
-        "N22Effects3[0]": 1,   # Medication 3 side effects
-        "N22Med4[0]": 1,       # Medication 4 name
-        "N22Effects4[0]": 1,   # Medication 4 side effects
-        "N22Med5[0]": 1,       # Medication 5 name
-        "N22Effects5[0]": 1,   # Medication 5 side effects
+@lru_cache(maxsize=8)
+def _load_template_bytes(template_path: str) -> bytes:
+    """Read a template once per process; filling opens a fresh document from these bytes"""
+    with open(template_path, 'rb') as template_file:
+        return template_file.read()
+
+def _fill_form_sync(template_path: str, fields: dict, line_limits) -> bytes:
+    """Fill a template and return the filled PDF bytes (blocking)"""
+    # Fill the form using your existing PDFFormFiller logic
+    template_bytes = _load_template_bytes(template_path)
+    with PDFFormFiller.from_dict(template_path, fields, pdf_bytes=template_bytes) as filler:
+        filler.set_multiple_field_limits(line_limits)
         
-        # Final remarks and additional information
-        "Remarks[0]": 13,       # Additional information/remarks
-    }
+        # Fill the form and serialize it in memory
+        filler.fill_form()
+        return filler.to_bytes()
 
-def get_available_templates():
-    """Get list of available PDF templates"""
+def _warm_up():
+    """No-op task used to start worker processes"""
+
+async def _run_blocking(func, *args):
+    """Run blocking PDF work on PDF_EXECUTOR so the event loop stays free (func must be module-level)"""
+    global PDF_EXECUTOR
+    executor = PDF_EXECUTOR
+    if executor is None:
+        # run_in_executor(None, ...) would fall back to threads, which PyMuPDF can't share
+        raise RuntimeError("PDF worker pool is not running; the app's startup event has not run")
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed) and took the pool with it; replace the
+        # pool, unless a concurrent request already did, and retry once
+        log.error("PDF worker pool broken, restarting it")
+        if PDF_EXECUTOR is executor:
+            PDF_EXECUTOR = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+            executor.shutdown(wait=False)
+        return await loop.run_in_executor(PDF_EXECUTOR, func, *args)
+
+# Default line limits for SSA-3373 form fields, built once at import. Keys
+# are interned; names like "N5text[0]" aren't identifiers, so Python
+# doesn't do that on its own.
+_LINE_LIMITS = MappingProxyType({sys.intern(field_name): max_lines for field_name, max_lines in {
+    # Main narrative fields
+    "N5text[0]": 7,      # Disability explanation
+    "N6text[0]": 4,      # Wake up to bed each day description
+    "N7text[0]": 1,      # Take care
+    "N9IfYesField[0]": 1, # Yes pets
+    "N10Field[0]": 1,     # What could you do that you can't now
+    "N11IfYesField[0]": 1, # Sleep
+    
+    # Personal care activities
+    "N12Dress[0]": 1,     # Dressing ability
+    "N12Bathe[0]": 1,     # Bathing ability  
+    "N12CareForHair[0]": 1, # Hair care ability
+    "N12Save[0]": 1,      # Shaving ability
+    "N12FeedSelf[0]": 1,  # Feeding ability
+    "N12UseTheToilet[0]": 1, # Toilet use ability
+    "N12Other[0]": 1,     # Other personal care
+    "N12BIfYesField[0]": 2, # Help received with personal care
+    "N12CIfYesField[0]": 3, # Changes in personal care abilities
+    
+    # Meals and Housework
+    "N13AIfYesField[0]": 2, # Meals Yes Description
+    "N13AHowOftenField[0]": 1, # How often meals
+    "N13AHowLong[0]": 1,   # How long taking meals
+    "N13AAnyChngsField[0]": 1, # Any changes meals
+    "N13BIfNoField[0]": 3, # Meals No Description
+    "N14AField[0]": 2,     # Housework
+    "N14BField[0]": 1,     # How long housework
+    "N14CIfYesField[0]": 1, # Encouraged housework
+    "N14dField[0]": 2,     # No housework - why not?
+    
+    # Transportation and mobility
+    "N15A[0]": 1,         # Go Outside
+    "N15AIfField[0]": 2,   # Why stopped driving
+    "N15CIfNoField[0]": 2, # Public transportation availability
+    "N15DIfYouDontDrive[0]": 2, # Transportation alternatives
+    
+    # Shopping and money management
+    "N16B[0]": 1,         # Shopping information
+    "N16C[0]": 1,         # Shopping limitations
+    "N17AExplain[0]": 2,   # Money handling explanation
+    "N17BIfYes[0]": 4,     # Changes in money management
+    
+    # Hobbies
+    "N18A[0]": 3,         # Hobbies overview
+    "N18B[0]": 2,         # Hobby frequency
+    "N18C[0]": 2,         # Hobby changes
+    
+    # Social activities and going out
+    "N15BOtherField[0]": 1, # Other transportation ability
+    "N19A[0]": 1,         # Explain other social activities
+    "N19B[0]": 1,         # 19c - list things on regular basis
+    "N19BHowOften[0]": 2,  # 19c Yes on need someone to accompany
+    "N19CIfYes[0]": 2,     # 19d Yes on problems with social activities
+    "N19D[0]": 2,         # 19e Describe any changes in social activities
+    
+    # Physical and cognitive limitations
+    "N20A[0]": 3,         # Physical limitations description
+    "N20C[0]": 1,         # Distance before stop and rest
+    "N20CIfYou[0]": 2,     # Rest time
+    "N20D[0]": 2,         # Cognitive/mental limitations
+    "N20F[0]": 2,         # How long follow instructions
+    "N20G[0]": 2,         # How well spoken instructions
+    "N20H[0]": 2,         # How well authority
+    
+    # Work history details
+    "N20IIfYesExplain[0]": 4, # Fired for problems getting along with others
+    "N20IIfYesEmployer[0]": 1, # Employer information
+    "N20J[0]": 1,         # Handle Stress
+    "N20K[0]": 2,         # Handle Change in Routine
+    "N20LIfYes[0]": 9,     # Unusual Behavior
+    
+    # Assistive devices and equipment
+    "N21IfOther[0]": 1,    # Other assistive devices
+    "N21Which[0]": 2,      # Which rx by doctor
+    "N21WhenPrescribed[0]": 2, # When rx by doctor
+    "N21WhenDoYou[0]": 7,   # When do you need to use
+    
+    # Medication details
+    "N22Med1[0]": 1,       # Medication 1 name
+    "N22Effects1[0]": 1,   # Medication 1 side effects
+    "N22Med2[0]": 1,       # Medication 2 name
+    "N22Effects2[0]": 1,   # Medication 2 side effects
+    "N22Med3[0]": 1,       # Medication 3 name
+    "N22Effects3[0]": 1,   # Medication 3 side effects
+    "N22Med4[0]": 1,       # Medication 4 name
+    "N22Effects4[0]": 1,   # Medication 4 side effects
+    "N22Med5[0]": 1,       # Medication 5 name
+    "N22Effects5[0]": 1,   # Medication 5 side effects
+    
+    # Final remarks and additional information
+    "Remarks[0]": 13,       # Additional information/remarks
+}.items()})
+
+def get_default_line_limits():
+    """Return the default line limits for SSA-3373 form fields (read-only)"""
+    return _LINE_LIMITS
+
+def _scan_templates() -> frozenset:
+    """Read the names of the PDF templates on disk"""
     template_dir = "templates"
     if os.path.exists(template_dir):
-        return [f for f in os.listdir(template_dir) if f.endswith('.pdf')]
-    return []
+        return frozenset(f for f in os.listdir(template_dir) if f.endswith('.pdf'))
+    return frozenset()
+
+# Templates only change on deploy, so the directory is listed once at import
+AVAILABLE_TEMPLATES = _scan_templates()
+
+def get_available_templates():
+    """Get list of available PDF templates"""
+    return sorted(AVAILABLE_TEMPLATES)
+
+class FilledPDF:
+    """A filled PDF and, once first requested, its base64 encoding"""
+    __slots__ = ("content", "_base64")
+    
+    def __init__(self, content: bytes):
+        self.content = content
+        self._base64 = None
+    
+    @property
+    def base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = pybase64.b64encode_as_string(self.content)
+        return self._base64
 
-async def generate_pdf_for_gpt(template_name: str, fields: dict) -> bytes:
+def _request_key(template_name: str, fields: dict, line_limits: Dict[str, int]) -> bytes:
+    """Digest of everything that determines a filled PDF"""
+    # Stdlib json rather than orjson: orjson writes NaN/Infinity as null, which
+    # would give {"x": NaN} and {"x": null} the same key but different PDFs
+    payload = json.dumps([template_name, fields, line_limits], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+async def _produce_pdf(template_name: str, fields: dict, line_limits: Optional[Dict[str, int]] = None) -> FilledPDF:
     """
-    Generate PDF using existing PDFFormFiller logic - for GPT endpoint
+    Fill a template off the event loop, reusing the result of an identical earlier request
+    
+    Args:
+        template_name: Template file name in the templates directory
+        fields: Dictionary of field_name -> value
+        line_limits: Field line limits (defaults to get_default_line_limits())
     """
-    try:
-        # Get template path
-        template_path = os.path.join("templates", template_name)
-        if not os.path.exists(template_path):
-            raise Exception(f"Template {template_name} not found. Available: {get_available_templates()}")
-        
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as json_temp:
-            json.dump(fields, json_temp, indent=2)
-            json_temp_path = json_temp.name
-        
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as output_temp:
-            output_temp_path = output_temp.name
-        
-        try:
-            # Fill the form using your existing PDFFormFiller logic
-            with PDFFormFiller(template_path, json_temp_path, output_temp_path) as filler:
-                
-                # Apply default line limits
-                line_limits = get_default_line_limits()
-                filler.set_multiple_field_limits(line_limits)
-                
-                # Fill and save the form
-                filler.fill_form()
-                filler.save()
-            
-            # Read the filled PDF
-            with open(output_temp_path, 'rb') as pdf_file:
-                pdf_content = pdf_file.read()
-                
-            return pdf_content
-            
-        finally:
-            # Cleanup temporary files
-            if os.path.exists(json_temp_path):
-                os.unlink(json_temp_path)
-            if os.path.exists(output_temp_path):
-                os.unlink(output_temp_path)
-                
-    except Exception as e:
-        print(f"PDF generation error: {e}")
-        raise Exception(f"PDF generation failed: {str(e)}")
+    if template_name not in AVAILABLE_TEMPLATES:
+        raise FileNotFoundError(f"Template {template_name} not found. Available templates: {get_available_templates()}")
+    
+    line_limits = dict(line_limits or get_default_line_limits())
+    key = _request_key(template_name, fields, line_limits)
+    filled_pdf = _PDF_CACHE.get(key)
+    if filled_pdf is not None:
+        _PDF_CACHE.move_to_end(key)
+        return filled_pdf
+    
+    template_path = os.path.join("templates", template_name)
+    filled_pdf = FilledPDF(await _run_blocking(_fill_form_sync, template_path, fields, line_limits))
+    _PDF_CACHE[key] = filled_pdf
+    if len(_PDF_CACHE) > PDF_CACHE_SIZE:
+        _PDF_CACHE.popitem(last=False)
+    return filled_pdf
+
+# Bodies of the GET endpoints below. They only depend on the code and the
+# templates snapshot, so they are serialized once at import.
+_HEALTH_JSON = orjson.dumps({
+    "status": "healthy", 
+    "service": "SSA-3373 PDF Form Filler",
+    "version": "1.0.0"
+})
+
+_FORM_INFO_JSON = orjson.dumps({
+    "available_templates": get_available_templates(),
+    "default_template": "ssa-3373-formatted-blank.pdf",
+    "default_line_limits_count": len(_LINE_LIMITS),
+    "api_endpoints": {
+        "fill_form": "/fill-ssa-form",
+        "fill_form_gpt": "/fill-ssa-form-gpt",
+        "health": "/health",
+        "form_info": "/form-info",
+        "docs": "/docs"
+    },
+    "template_directory": "templates/",
+    "supported_methods": ["POST /fill-ssa-form", "POST /fill-ssa-form-gpt"]
+})
+
+_LINE_LIMITS_JSON = orjson.dumps({
+    "default_line_limits": dict(_LINE_LIMITS),
+    "total_fields_with_limits": len(_LINE_LIMITS),
+    "description": "These are the default line limits applied to multiline fields in the SSA-3373 form"
+})
+
+_ROOT_JSON = orjson.dumps({
+    "message": "SSA-3373 PDF Form Filler API",
+    "version": "1.0.0",
+    "documentation": "/docs",
+    "health_check": "/health",
+    "form_info": "/form-info",
+    "main_endpoint": "/fill-ssa-form"
+})
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy", 
-        "service": "SSA-3373 PDF Form Filler",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 @app.get("/form-info")
 async def get_form_info():
     """Debug endpoint to see available templates and configuration info"""
-    templates = get_available_templates()
-    
-    return {
-        "available_templates": templates,
-        "default_template": "ssa-3373-formatted-blank.pdf",
-        "default_line_limits_count": len(get_default_line_limits()),
-        "api_endpoints": {
-            "fill_form": "/fill-ssa-form",
-            "fill_form_gpt": "/fill-ssa-form-gpt",
-            "health": "/health",
-            "form_info": "/form-info",
-            "docs": "/docs"
-        },
-        "template_directory": "templates/",
-        "supported_methods": ["POST /fill-ssa-form", "POST /fill-ssa-form-gpt"]
-    }
+    return Response(content=_FORM_INFO_JSON, media_type="application/json")
 
 @app.get("/line-limits")
 async def get_line_limits():
     """Get the default line limits configuration"""
-    return {
-        "default_line_limits": get_default_line_limits(),
-        "total_fields_with_limits": len(get_default_line_limits()),
-        "description": "These are the default line limits applied to multiline fields in the SSA-3373 form"
-    }
+    return Response(content=_LINE_LIMITS_JSON, media_type="application/json")
 
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "SSA-3373 PDF Form Filler API",
-        "version": "1.0.0",
-        "documentation": "/docs",
-        "health_check": "/health",
-        "form_info": "/form-info",
-        "main_endpoint": "/fill-ssa-form"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the PDF form filler's text wrapping
+Usage: python -m pytest
+"""
+
+import os
+import random
+
+import pytest
+
+from fill_pdf_form import PDFFormFiller
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "templates", "ssa-3373-formatted-blank.pdf")
+FONT_SIZE = 11
+CHAR_WIDTH = FONT_SIZE * 0.45
+
+
+@pytest.fixture(scope="module")
+def filler():
+    filler = PDFFormFiller.from_dict(TEMPLATE_PATH, {"fields": {}})
+    yield filler
+    filler.close()
+
+
+def break_word_per_character(filler, word, max_width):
+    """Split a word the way the filler originally did, growing each segment one character at a time"""
+    segments = []
+    current_segment = ""
+
+    for char in word:
+        test_segment = current_segment + char
+        if filler._get_text_width(test_segment, FONT_SIZE, "helv") <= max_width:
+            current_segment = test_segment
+        else:
+            if current_segment:
+                segments.append(current_segment)
+                current_segment = char
+            else:
+                segments.append(char)
+                current_segment = ""
+
+    if current_segment:
+        segments.append(current_segment)
+
+    return segments if segments else [word]
+
+
+@pytest.mark.parametrize("chars_per_line", range(1, 40))
+@pytest.mark.parametrize("word_length", [1, 2, 7, 20, 32, 33, 100])
+def test_break_long_word_at_exact_multiples_of_char_width(filler, chars_per_line, word_length):
+    word = "x" * word_length
+    max_width = chars_per_line * CHAR_WIDTH
+
+    assert filler._break_long_word(word, max_width, FONT_SIZE, "helv") == \
+        break_word_per_character(filler, word, max_width)
+
+
+def test_break_long_word_matches_per_character_split(filler):
+    rng = random.Random(3373)
+
+    for _ in range(5000):
+        word = "y" * rng.randint(1, 120)
+        max_width = rng.choice([rng.uniform(0, 200), rng.randint(0, 40) * CHAR_WIDTH])
+        assert filler._break_long_word(word, max_width, FONT_SIZE, "helv") == \
+            break_word_per_character(filler, word, max_width), (len(word), max_width)